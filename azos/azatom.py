@@ -97,20 +97,57 @@ def is_valid(id: int) -> bool:
     ax = id
     for i in range(0, 8):
         c = ax & 0xff
+        if c == 0: #zero byte terminates the value, the remaining bytes must also be zero
+            return ax == 0
         if not __validate_char(c):
             return False
         ax = ax >> 8
     return True
 
+_interned = { } #Atom intern table: source string -> instance
+
 class Atom:
     """Encapsulates an Atom value which is up to 8 ASCII only characters coded as an int
 
+    Instances built from strings are interned: repeated `Atom("dealer")` returns the same
+    object via a dict hit instead of re-running the encode/validate scan. Atoms represent
+    a finite set of values by design (see `decode` warning), so the table stays small.
     """
-    def __init__(self, val: int | str) -> None:
+    def __new__(cls, val: int | str) -> 'Atom':
         if val == None or type(val) == str:
-            self._id = encode(val)
-        else:
-            self._id = val
+            hit = _interned.get(val)
+            if hit is not None:
+                return hit
+            atom = super().__new__(cls)
+            atom._id = encode(val)
+            _interned[val] = atom
+            return atom
+
+        atom = super().__new__(cls)
+        atom._id = val
+        return atom
+
+    @classmethod
+    def try_from(cls, val: int | str) -> 'Atom | None':
+        """Creates an Atom from an int or string value returning None instead of raising on invalid input
+
+        Use this instead of `try: Atom(v) except AzosError:` when rejection is the expected
+        outcome (e.g. parsing untrusted input) - it avoids the exception raise/unwind cost.
+        """
+        if val == None or val == "":
+            return cls(0)
+
+        if type(val) == str:
+            if len(val) > MAX_ATOM_LENGTH:
+                return None
+            for one in val:
+                if ord(one) not in VALID_CHAR_CODES:
+                    return None
+            return cls(val)
+
+        if not is_valid(val):
+            return None
+        return cls(val)
 
     def __str__(self):
         return decode(self._id)
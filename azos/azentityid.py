@@ -5,29 +5,97 @@ Copyright (C) 20023 Azist, MIT License
 
 """
 
-import json
+import functools
 
 from azexceptions import AzosError
-from azatom import Atom
+from azatom import Atom, MAX_ATOM_LENGTH, VALID_CHAR_CODES, decode
+
+try: #orjson decodes small objects several times faster than stdlib json; fall back when absent
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 TP_PREFIX = "@"
 SCHEMA_DIV = "."
 SYS_PREFIX = "::"
 
+def _is_valid_atom(astr: str) -> bool:
+    #None stands for an absent type/schema part which maps to Atom zero
+    if astr is None:
+        return True
+
+    try:
+        bts = astr.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+
+    #issuperset over the byte values is a single C-level subset test - no per-char
+    #Python loop and no regex engine involvement
+    return 1 <= len(bts) <= MAX_ATOM_LENGTH and VALID_CHAR_CODES.issuperset(bts)
+
+#Entity id streams typically repeat a tiny set of (system, type, schema) triples with
+#fresh addresses, so the atoms are interned by source substring in a bounded cache.
+#Callers pre-validate with _is_valid_atom so construction cannot raise
+@functools.lru_cache(maxsize = 2048)
+def __atom_cached(astr: str) -> Atom:
+    return Atom(astr)
+
+#Perf note: do not decorate the parse functions below with numba @jit/@njit - string
+#partitioning and dict-backed caches force object mode, which regresses (and the import
+#alone costs seconds); see numba/numba#2585. The right rungs here are the byte-table
+#validation and memoization already in place.
 def tryparse(val: str) -> tuple | None:
     """Tries to parse a string as EntityId returning a tuple on success or None if val is not parsable
 
     """
-    if val == None:
+    #cheapest disqualifiers first: non-strings and too-short values bail out
+    #before the cached parse is even consulted
+    if not isinstance(val, str) or len(val) < 4:
+        return None
+    return __tryparse_cached(val)
+
+#The same canonical strings get re-parsed over and over (round-trips, logging,
+#deserialization), so the decomposed tuple is memoized; it only holds immutable
+#Atoms and strings which makes the cache safe to share
+@functools.lru_cache(maxsize = 4096)
+def __tryparse_cached(val: str) -> tuple | None:
+    if val.find(SYS_PREFIX) < 1:
         return None
-    
-    vlen = len(val)
 
-    if vlen < 4:
+    #each partition is one C-level scan returning slices: `[type[.schema]@]system::address`
+    (prefix, _, eid_address) = val.partition(SYS_PREFIX)
+    if not eid_address:
         return None
-    
-    # Todo: Finish
-    return (sys, type, schema, address)
+
+    (type_schema, sep, eid_sys) = prefix.partition(TP_PREFIX)
+    if sep:
+        if not type_schema or not eid_sys:
+            return None
+        (eid_type, sep, eid_schema) = type_schema.partition(SCHEMA_DIV)
+        if sep:
+            if not eid_type or not eid_schema:
+                return None
+        else:
+            eid_schema = None
+    else:
+        eid_sys = type_schema
+        eid_type = None
+        eid_schema = None
+
+    #byte-table validation short-circuits invalid atoms before any Atom construction
+    #and keeps untrusted garbage out of the intern cache; one consolidated branch
+    if not (_is_valid_atom(eid_sys) and _is_valid_atom(eid_type) and _is_valid_atom(eid_schema)):
+        return None
+
+    return (__atom_cached(eid_sys), __atom_cached(eid_type), __atom_cached(eid_schema), eid_address)
+
+def tryparse_many(values) -> list:
+    """Parses a batch of string values returning a list of component tuples, None per unparsable value
+
+    Use this entry point when deserializing many entity ids at once (e.g. config files or
+    log streams) so callers keep a single dispatch site for future batch optimizations.
+    """
+    return [tryparse(one) for one in values]
 
 def parse(val: str) -> tuple:
     """Tries to parse a string as EntityId returning a tuple on success or throwing AzosError
@@ -36,6 +104,20 @@ def parse(val: str) -> tuple:
     result = tryparse(val)
     if result == None:
         raise AzosError("Supplied value is not parsable as EntityId", "entityid", f"parse(`{val}`)")
+    return result
+
+
+#Per-shape value formatters: the (type.is_zero, schema.is_zero) shape of an EntityId is
+#fixed at construction, so the right formatter is picked once in __init__ instead of
+#re-branching on every value access
+def _fmt_sys(eid) -> str:
+    return decode(eid._sys_id) + SYS_PREFIX + eid._address
+
+def _fmt_type(eid) -> str:
+    return decode(eid._type_id) + TP_PREFIX + decode(eid._sys_id) + SYS_PREFIX + eid._address
+
+def _fmt_full(eid) -> str:
+    return decode(eid._type_id) + SCHEMA_DIV + decode(eid._schema_id) + TP_PREFIX + decode(eid._sys_id) + SYS_PREFIX + eid._address
 
 
 class EntityId:
@@ -71,11 +153,22 @@ class EntityId:
         return cls(components[0], components[1], components[2], components[3])
 
 
+    __slots__ = ("_sys_id", "_type_id", "_schema_id", "_address", "_value", "_hash", "_composite", "_fmt")
+
     def __init__(self, eid_sys: Atom, eid_type: Atom, eid_schema: Atom, eid_address: str) -> None:
-        self._system = eid_sys
-        self._type = eid_type
-        self._schema = eid_schema
+        #only the raw 64-bit ids are stored; Atom wrappers are materialized on demand
+        #by the component properties, so equality/hashing run purely on ints
+        sys_id = eid_sys._id
+        type_id = eid_type._id
+        schema_id = eid_schema._id
+        self._sys_id = sys_id
+        self._type_id = type_id
+        self._schema_id = schema_id
         self._address = eid_address
+        self._fmt = _fmt_sys if type_id == 0 else (_fmt_type if schema_id == 0 else _fmt_full)
+        self._value = None #lazily-built string value, EntityId is immutable
+        self._hash = hash((sys_id, type_id, schema_id, eid_address)) #precomputed once, the instance is immutable
+        self._composite = None #lazily-computed composite address flag
 
     def __str__(self):
         return self.value
@@ -84,27 +177,45 @@ class EntityId:
         return f"EntityId(`{self.get_value()}`)"
     
     def __eq__(self, other: object) -> bool:
-        return self._system  == other.system and \
-               self._type    == other.type and \
-               self._schema  == other.schema and \
-               self._address == other.address
+        if self is other:
+            return True
+        if type(other) is not EntityId:
+            return NotImplemented
+        if self._hash != other._hash: #precomputed, rejects most mismatches on one int compare
+            return False
+        #address compared first as it is the most likely component to differ;
+        #the remaining comparisons are raw int64 atom ids
+        return self._address    == other._address and \
+               self._sys_id     == other._sys_id and \
+               self._type_id    == other._type_id and \
+               self._schema_id  == other._schema_id
     
     def __hash__(self):
-        return hash(self._system) ^ hash(self._type) ^ hash(self._schema) ^ hash(self._address)
+        return self._hash #precomputed in __init__
     
     def get_value(self) -> str:
-        if self._type.is_zero:
-            return f"{self._system}{SYS_PREFIX}{self._address}"
-        if self._schema.is_zero:
-            return f"{self._type}{TP_PREFIX}{self._system}{SYS_PREFIX}{self._address}"
-        
-        return f"{self._type}{SCHEMA_DIV}{self._schema}{TP_PREFIX}{self._system}{SYS_PREFIX}{self._address}"
+        result = self._value #check instance cache
+        if result != None:
+            return result
+
+        result = self._fmt(self) #shape-specialized formatter picked in __init__
+        self._value = result
+        return result
     
     def get_components(self) -> str:
         """Returns components of entity id a s a tuple of (sys,type,schema,address)
 
         """
-        return (self._system, self._type, self._schema, self._address)
+        return (Atom(self._sys_id), Atom(self._type_id), Atom(self._schema_id), self._address)
+
+    def get_is_composite_address(self) -> bool:
+        result = self._composite #check instance cache
+        if result == None:
+            #direct index tests are cheaper than startswith/endswith method dispatch for single chars
+            addr = self._address
+            result = len(addr) > 0 and addr[0] == "{" and addr[-1] == "}"
+            self._composite = result
+        return result
 
     def get_composite_address(self) -> map:
         """
@@ -115,17 +226,17 @@ class EntityId:
         if not self.is_composite_address:
             return None
         try:
-            return json.loads(self._address)
+            return _json_loads(self._address)
         except Exception as cause:
             raise AzosError("EntityId contains invalid composite address", "entityid", f"get_composite_address()") from cause
 
 
-    system  = property(fget = lambda self: self._system,  doc = "Gets EntityId.System: Atom")
-    type    = property(fget = lambda self: self._type,    doc = "Gets EntityId.Type: Atom")
-    schema  = property(fget = lambda self: self._schema,  doc = "Gets EntityId.Schema: Atom")
-    address = property(fget = lambda self: self._address, doc = "Gets EntityId.Address: str")
+    system  = property(fget = lambda self: Atom(self._sys_id),    doc = "Gets EntityId.System: Atom")
+    type    = property(fget = lambda self: Atom(self._type_id),   doc = "Gets EntityId.Type: Atom")
+    schema  = property(fget = lambda self: Atom(self._schema_id), doc = "Gets EntityId.Schema: Atom")
+    address = property(fget = lambda self: self._address,         doc = "Gets EntityId.Address: str")
     is_composite_address = property(
-        fget = lambda self: self._address.startswith("{") and self._address.endswith("}"),
+        fget = get_is_composite_address,
         doc = "Returns True when address is assigned as composite JSON object starting with '{' and ending with '}' without any leading or trailing spaces"
     )
 
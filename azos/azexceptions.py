@@ -17,11 +17,16 @@ class AzosError(Exception):
         message -- explanation of the error
     """
 
+    __slots__ = ("topic", "frm", "src", "message")
+
     def __init__(self, message="Azos unspecified error", topic = "azos", frm = "", src = 0):
         self.topic = topic
         self.frm = frm
         self.src = src
         self.message = message
-        super().__init__(self.message)
+        Exception.__init__(self) #skip args tuple packing, __str__ supplies the message
+
+    def __str__(self):
+        return self.message
 
 
@@ -93,7 +93,7 @@ class AtomTests(unittest.TestCase):
     def test_class_03(self):
         a = azatom.Atom("a")
         b = azatom.Atom("a")
-        self.assertFalse(a is b);
+        self.assertTrue(a is b); # string-built atoms are interned
         self.assertTrue(a == b);
         self.assertEqual(hash(a), hash(b))
 
@@ -0,0 +1,158 @@
+import unittest
+import azcontext
+
+import azentityid
+from azatom import Atom
+from azexceptions import AzosError
+
+
+# atoms used across many assertions are built once per import instead of re-encoding
+# the literal in every test
+A_DEALER = Atom("dealer")
+A_CAR    = Atom("car")
+A_VIN    = Atom("vin")
+A_BOAT   = Atom("boat")
+A_SYS    = Atom("sys")
+A_ZERO   = Atom(0)
+
+
+# one shared vector of unparsable values; the invalid-input tests iterate it via
+# subTest instead of declaring a separate test function per case
+INVALID_VALUES = [
+    None,
+    123,
+    "",
+    "invalid_string",
+    "a:b",
+    "::address",
+    "sys::",
+    "sys tem::addr",
+    "deal$er::addr",
+    "toolongatomstr::addr",
+    "car.vin@::addr",
+    ".schema@sys::addr",
+    "car.@sys::addr",
+    "@sys::addr",
+    "car.vin.extra@sys::addr",
+    "ca#r@sys::addr",
+    "car.s ch@sys::addr",
+]
+
+
+class EntityIdTests(unittest.TestCase):
+
+    def test_tryparse_invalid(self):
+        for one in INVALID_VALUES:
+            with self.subTest(val = one):
+                self.assertIsNone(azentityid.tryparse(one))
+
+    def test_parse_invalid(self):
+        for one in INVALID_VALUES:
+            with self.subTest(val = one):
+                with self.assertRaises(AzosError):
+                    azentityid.parse(one)
+
+    def test_from_value_invalid(self):
+        for one in INVALID_VALUES:
+            with self.subTest(val = one):
+                with self.assertRaises(AzosError):
+                    azentityid.EntityId.from_value(one)
+
+    def test_tryparse_01(self):
+        (eid_sys, eid_type, eid_schema, eid_address) = azentityid.tryparse("car.vin@dealer::1A8987339HBz0909W874")
+        self.assertEqual(A_DEALER, eid_sys)
+        self.assertEqual(A_CAR, eid_type)
+        self.assertEqual(A_VIN, eid_schema)
+        self.assertEqual("1A8987339HBz0909W874", eid_address)
+
+    def test_tryparse_02(self):
+        (eid_sys, eid_type, eid_schema, eid_address) = azentityid.tryparse("boat@dealer::I9973OD")
+        self.assertEqual(A_DEALER, eid_sys)
+        self.assertEqual(A_BOAT, eid_type)
+        self.assertTrue(eid_schema.is_zero)
+        self.assertEqual("I9973OD", eid_address)
+
+    def test_tryparse_03(self):
+        (eid_sys, eid_type, eid_schema, eid_address) = azentityid.tryparse("dealer::I9973OD")
+        self.assertEqual(A_DEALER, eid_sys)
+        self.assertTrue(eid_type.is_zero)
+        self.assertTrue(eid_schema.is_zero)
+        self.assertEqual("I9973OD", eid_address)
+
+    def test_tryparse_many_01(self):
+        result = azentityid.tryparse_many(["dealer::I9973OD", "bad value", None])
+        self.assertEqual(3, len(result))
+        self.assertIsNotNone(result[0])
+        self.assertIsNone(result[1])
+        self.assertIsNone(result[2])
+
+    def test_parse_01(self):
+        (eid_sys, eid_type, eid_schema, eid_address) = azentityid.parse("car.vin@dealer::ABC123")
+        self.assertEqual(A_DEALER, eid_sys)
+        self.assertEqual(A_CAR, eid_type)
+        self.assertEqual(A_VIN, eid_schema)
+        self.assertEqual("ABC123", eid_address)
+
+    def test_parse_02(self):
+        try:
+            azentityid.parse("no system divider")
+        except AzosError as error:
+            self.assertEqual("parse(`no system divider`)", error.frm)
+        else:
+            self.fail("Missing AzosError for invalid entity id string")
+
+    def test_from_value_01(self):
+        eid = azentityid.EntityId.from_value("car.vin@dealer::1A8987339HBz0909W874")
+        self.assertEqual(A_DEALER, eid.system)
+        self.assertEqual(A_CAR, eid.type)
+        self.assertEqual(A_VIN, eid.schema)
+        self.assertEqual("1A8987339HBz0909W874", eid.address)
+
+    def test_value_roundtrip_01(self):
+        for one in ["car.vin@dealer::1A8987339HBz0909W874", "boat@dealer::I9973OD", "dealer::I9973OD"]:
+            with self.subTest(val = one):
+                self.assertEqual(one, azentityid.EntityId.from_value(one).value)
+                self.assertEqual(one, str(azentityid.EntityId.from_value(one)))
+
+    def test_eq_01(self):
+        a = azentityid.EntityId.from_value("car.vin@dealer::ABC")
+        b = azentityid.EntityId.from_value("car.vin@dealer::ABC")
+        self.assertFalse(a is b)
+        self.assertTrue(a == b)
+        self.assertEqual(hash(a), hash(b))
+
+    def test_eq_02(self):
+        a = azentityid.EntityId.from_value("car.vin@dealer::ABC")
+        b = azentityid.EntityId.from_value("car.vin@dealer::ABD")
+        self.assertFalse(a == b)
+
+    def test_eq_03(self):
+        a = azentityid.EntityId.from_value("car.vin@dealer::ABC")
+        self.assertFalse(a == "car.vin@dealer::ABC")
+
+    def test_components_01(self):
+        eid = azentityid.EntityId.from_value("car.vin@dealer::ABC")
+        self.assertEqual((A_DEALER, A_CAR, A_VIN, "ABC"), eid.components)
+
+    def test_composite_address_01(self):
+        eid = azentityid.EntityId(A_SYS, A_ZERO, A_ZERO, "{\"a\": 1}")
+        self.assertTrue(eid.is_composite_address)
+        self.assertEqual({"a": 1}, eid.get_composite_address())
+
+    def test_composite_address_02(self):
+        eid = azentityid.EntityId(A_SYS, A_ZERO, A_ZERO, "plain")
+        self.assertFalse(eid.is_composite_address)
+        self.assertIsNone(eid.get_composite_address())
+
+    def test_composite_address_03(self):
+        eid = azentityid.EntityId(A_SYS, A_ZERO, A_ZERO, "{not json}")
+        try:
+            eid.get_composite_address()
+        except AzosError as error:
+            self.assertEqual("get_composite_address()", error.frm)
+        else:
+            self.fail("Missing AzosError for invalid composite address")
+
+
+if __name__ == '__main__':
+    unittest.main()